@@ -0,0 +1,3 @@
+"""Interactive setup wizard for the AWS security baseline Terraform templates."""
+
+__version__ = "0.1.0"
@@ -0,0 +1,146 @@
+"""Command-line argument handling for non-interactive wizard runs."""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import re
+
+from wizard.models import AVAILABLE_MODULES, EXPECTED_MODULE_NAMES, WizardConfig
+
+DEFAULT_REGION = "us-east-1"
+DEFAULT_ENVIRONMENT = "prod"
+DEFAULT_OUTPUT = "terraform.tfvars"
+
+_REGION_RE = re.compile(r"^[a-z]{2}-[a-z]+-\d+$")
+_ENV_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9-]*$")
+
+
+def validate_region_arg(value: str) -> str:
+    """argparse type callable for --region."""
+    if not _REGION_RE.match(value):
+        raise argparse.ArgumentTypeError(
+            f"{value!r} is not a valid AWS region code (expected e.g. us-east-1)"
+        )
+    return value
+
+
+def validate_environment_arg(value: str) -> str:
+    """argparse type callable for --environment."""
+    if not _ENV_RE.match(value):
+        raise argparse.ArgumentTypeError(
+            f"{value!r} is not a valid environment name (letters, digits and hyphens only)"
+        )
+    return value
+
+
+def validate_tag_arg(value: str) -> tuple[str, str]:
+    """argparse type callable for --tag KEY=VALUE pairs."""
+    key, sep, tag_value = value.partition("=")
+    if not sep or not key.strip():
+        raise argparse.ArgumentTypeError(f"tags must look like KEY=VALUE, got {value!r}")
+    return key, tag_value
+
+
+def validate_modules_arg(value: str) -> list[str]:
+    """argparse type callable for --modules as a comma-separated name list."""
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXPECTED_MODULE_NAMES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown modules: {', '.join(unknown)} "
+            f"(choose from {', '.join(sorted(EXPECTED_MODULE_NAMES))})"
+        )
+    return names
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="wizard",
+        description=(
+            "Generate terraform.tfvars for the AWS security baseline. "
+            "With no arguments the interactive wizard runs instead."
+        ),
+    )
+    parser.add_argument(
+        "--region",
+        type=validate_region_arg,
+        default=DEFAULT_REGION,
+        help=f"AWS region to deploy into (default: {DEFAULT_REGION})",
+    )
+    parser.add_argument(
+        "--environment",
+        type=validate_environment_arg,
+        default=DEFAULT_ENVIRONMENT,
+        help=f"Environment name used in resource tags (default: {DEFAULT_ENVIRONMENT})",
+    )
+    parser.add_argument(
+        "--tag",
+        dest="tags",
+        action="append",
+        type=validate_tag_arg,
+        default=None,
+        metavar="KEY=VALUE",
+        help="Extra resource tag; may be given multiple times",
+    )
+    parser.add_argument(
+        "--all-modules",
+        action="store_true",
+        help="Enable every security service in the baseline",
+    )
+    parser.add_argument(
+        "--modules",
+        type=validate_modules_arg,
+        default=None,
+        metavar="NAME[,NAME...]",
+        help="Enable only the listed security services",
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT,
+        help=f"Where to write the generated tfvars file (default: {DEFAULT_OUTPUT})",
+    )
+    return parser
+
+
+# The parser is static, so build it once at import instead of on every
+# parse_args call (add_argument and type registration are not cheap).
+_PARSER = _build_parser()
+
+# Snapshot of an all-defaults parse, used to detect non-interactive mode
+# with a single dict comparison.
+_DEFAULT_ARGS_VARS = vars(_PARSER.parse_args([]))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments for the wizard."""
+    return _PARSER.parse_args(argv)
+
+
+@functools.lru_cache(maxsize=1)
+def get_help_text() -> str:
+    """Return the full --help output for the wizard CLI."""
+    return _PARSER.format_help()
+
+
+def has_cli_args(args: argparse.Namespace) -> bool:
+    """Return True if any argument differs from its default, i.e. non-interactive mode."""
+    return vars(args) != _DEFAULT_ARGS_VARS
+
+
+def run_non_interactive_mode(args: argparse.Namespace) -> WizardConfig:
+    """Build a WizardConfig directly from parsed CLI arguments."""
+    if args.modules and not args.all_modules:
+        requested = set(args.modules)
+        modules = {module.name: module.name in requested for module in AVAILABLE_MODULES}
+    else:
+        modules = {module.name: True for module in AVAILABLE_MODULES}
+    tags = {"Environment": args.environment, "ManagedBy": "Terraform"}
+    if args.tags:
+        tags.update(args.tags)
+    return WizardConfig(
+        modules=modules,
+        region=args.region,
+        environment=args.environment,
+        tags=tags,
+    )
@@ -0,0 +1,24 @@
+"""Shared pytest and Hypothesis configuration for the wizard test tree."""
+
+import os
+
+from hypothesis import HealthCheck, settings
+
+# Local runs iterate with a small, deterministic example budget and no
+# filesystem-backed example database; CI selects the full-coverage
+# profile via HYPOTHESIS_PROFILE=ci.
+settings.register_profile(
+    "ci",
+    max_examples=100,
+    deadline=None,
+    database=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile(
+    "dev",
+    max_examples=25,
+    deadline=None,
+    database=None,
+    derandomize=True,
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
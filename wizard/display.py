@@ -0,0 +1,134 @@
+"""Rich console output for the setup wizard."""
+
+from __future__ import annotations
+
+import functools
+import itertools
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from wizard.models import AVAILABLE_MODULES, WizardConfig
+
+GITHUB_URL = "https://github.com/jsredmond/aws-security-baseline"
+
+_DEFAULT_CONSOLE: Console | None = None
+
+
+def _console(console: Console | None) -> Console:
+    """Return the given console, or a lazily created shared default."""
+    global _DEFAULT_CONSOLE
+    if console is not None:
+        return console
+    if _DEFAULT_CONSOLE is None:
+        _DEFAULT_CONSOLE = Console()
+    return _DEFAULT_CONSOLE
+
+
+ASCII_BANNER = r"""
+   ___  _    _ ___   ___                  _ _
+  / _ \| |  | / __| / __| ___ __ _  _ _ _(_) |_ _  _
+ | |_| | |/\| \__ \ \__ \/ -_) _| || | '_| |  _| || |
+  \_/\_\__/\__|___/ |___/\___\__|\_,_|_| |_|\__|\_, |
+                  B a s e l i n e               |__/
+"""
+
+# The banner is static, so parse the markup exactly once at import time
+# instead of rebuilding a Text span-by-span on every call.
+_BANNER_TEXT = Text.from_markup(
+    "[bold cyan]" + ASCII_BANNER + "[/bold cyan]\n"
+    "[italic white]Deploy AWS security services with confidence[/italic white]\n\n"
+    "[dim]GitHub:[/dim] [bold blue underline]" + GITHUB_URL + "[/]"
+)
+
+_NEXT_STEPS_TEMPLATE = (
+    "[bold green]Configuration written to[/bold green] [bold white]{output_path}[/bold white]\n\n"
+    "[bold]Next steps:[/bold]\n"
+    "  [cyan]1.[/cyan] Review {output_path} and adjust anything you want to change\n"
+    "  [cyan]2.[/cyan] Run [bold yellow]aws configure[/bold yellow] if your credentials are not set up\n"
+    "  [cyan]3.[/cyan] Run [bold yellow]terraform init[/bold yellow]\n"
+    "  [cyan]4.[/cyan] Run [bold yellow]terraform plan[/bold yellow]\n"
+    "  [cyan]5.[/cyan] Run [bold yellow]terraform apply[/bold yellow]"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_banner_content() -> str:
+    """Return the welcome banner as plain text, without console markup."""
+    return _BANNER_TEXT.plain
+
+
+@functools.lru_cache(maxsize=32)
+def get_next_steps_content(output_path: str = "terraform.tfvars") -> str:
+    """Return the post-generation instructions as plain text."""
+    return Text.from_markup(_NEXT_STEPS_TEMPLATE.format(output_path=output_path)).plain
+
+
+def display_banner(console: Console | None = None) -> str:
+    """Print the welcome banner and return its plain-text content."""
+    console = _console(console)
+    console.print(_BANNER_TEXT)
+    return get_banner_content()
+
+
+def display_next_steps(
+    output_path: str = "terraform.tfvars", console: Console | None = None
+) -> str:
+    """Print the post-generation instructions and return their plain-text content."""
+    console = _console(console)
+    console.print(
+        Panel(
+            Text.from_markup(_NEXT_STEPS_TEMPLATE.format(output_path=output_path)),
+            title="All done",
+            border_style="green",
+        )
+    )
+    return get_next_steps_content(output_path)
+
+
+def get_summary_content(config: WizardConfig) -> str:
+    """Build the plain-text configuration summary shown before generation."""
+    modules = config.modules
+    tags = config.tags
+    return "\n".join(
+        itertools.chain(
+            ("Selected Modules:",),
+            (
+                f"  {module.display_name}: "
+                f"{'Enabled' if modules.get(module.name, False) else 'Disabled'}"
+                for module in AVAILABLE_MODULES
+            ),
+            (
+                "",
+                "Deployment Settings:",
+                f"  Region: {config.region}",
+                f"  Environment: {config.environment}",
+                "",
+                "Resource Tags:",
+            ),
+            (f"  {key}: {value}" for key, value in tags.items()),
+        )
+    )
+
+
+def display_summary(config: WizardConfig, console: Console | None = None) -> None:
+    """Print the configuration summary table for final confirmation."""
+    console = _console(console)
+    table = Table(title="Configuration Summary", show_header=True, header_style="bold cyan")
+    table.add_column("Setting")
+    table.add_column("Value")
+    modules = config.modules
+    add_row = table.add_row
+    for module in AVAILABLE_MODULES:
+        enabled = modules.get(module.name, False)
+        add_row(
+            module.display_name,
+            "[green]Enabled[/green]" if enabled else "[dim]Disabled[/dim]",
+        )
+    add_row("Region", config.region)
+    add_row("Environment", config.environment)
+    for key, value in config.tags.items():
+        add_row(f"Tag: {key}", value)
+    console.print(table)
@@ -0,0 +1,17 @@
+"""Exception types raised by the setup wizard."""
+
+
+class WizardError(Exception):
+    """Base class for wizard failures."""
+
+
+class InvalidInputError(WizardError):
+    """Raised when user-provided input fails validation."""
+
+
+class FileGenerationError(WizardError):
+    """Raised when the tfvars file cannot be written."""
+
+
+class DependencyError(WizardError):
+    """Raised when a required third-party package is missing."""
@@ -0,0 +1,100 @@
+"""Generation and parsing of terraform.tfvars content."""
+
+from __future__ import annotations
+
+import re
+
+from rich.console import Console
+
+from wizard.models import AVAILABLE_MODULES, WizardConfig
+
+_HEADER = "# Generated by the aws-security-baseline setup wizard"
+
+_VAR_TO_NAME = {module.var_name: module.name for module in AVAILABLE_MODULES}
+
+_STRING_LINE_RE = re.compile(r'^(\w+)\s*=\s*"(.*)"$')
+_BOOL_LINE_RE = re.compile(r"^(\w+)\s*=\s*(true|false)$")
+_TAG_LINE_RE = re.compile(r'^"((?:[^"\\]|\\.)*)"\s*=\s*"((?:[^"\\]|\\.)*)"$')
+_UNESCAPE_RE = re.compile(r"\\(.)")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _unescape(value: str) -> str:
+    return _UNESCAPE_RE.sub(r"\1", value)
+
+
+def generate_tfvars_content(config: WizardConfig) -> str:
+    """Render a WizardConfig as terraform.tfvars HCL."""
+    lines = [
+        _HEADER,
+        "",
+        f'aws_region = "{config.region}"',
+        f'environment = "{config.environment}"',
+        "",
+    ]
+    for module in AVAILABLE_MODULES:
+        enabled = config.modules.get(module.name, False)
+        lines.append(f"{module.var_name} = {'true' if enabled else 'false'}")
+    lines.append("")
+    lines.append("tags = {")
+    for key, value in config.tags.items():
+        lines.append(f'  "{_escape(key)}" = "{_escape(value)}"')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_tfvars_content(content: str) -> WizardConfig:
+    """Parse generated tfvars content back into a WizardConfig.
+
+    Only understands the subset of HCL that generate_tfvars_content
+    emits; used for round-trip verification, not general HCL parsing.
+    """
+    config = WizardConfig(modules={}, region="", environment="", tags={})
+    in_tags = False
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if in_tags:
+            if stripped == "}":
+                in_tags = False
+                continue
+            match = _TAG_LINE_RE.match(stripped)
+            if match:
+                config.tags[_unescape(match.group(1))] = _unescape(match.group(2))
+            continue
+        if stripped == "tags = {":
+            in_tags = True
+            continue
+        match = _BOOL_LINE_RE.match(stripped)
+        if match and match.group(1) in _VAR_TO_NAME:
+            config.modules[_VAR_TO_NAME[match.group(1)]] = match.group(2) == "true"
+            continue
+        match = _STRING_LINE_RE.match(stripped)
+        if match:
+            if match.group(1) == "aws_region":
+                config.region = match.group(2)
+            elif match.group(1) == "environment":
+                config.environment = match.group(2)
+    return config
+
+
+def generate_tfvars(
+    config: WizardConfig,
+    output_path: str = "terraform.tfvars",
+    console: Console | None = None,
+) -> bool:
+    """Write the rendered tfvars to output_path; returns False on I/O failure."""
+    if console is None:
+        console = Console()
+    try:
+        with open(output_path, "w", encoding="utf-8") as handle:
+            handle.write(generate_tfvars_content(config))
+    except OSError as error:
+        console.print(f"[red]Could not write {output_path}: {error}[/red]")
+        return False
+    console.print(f"[green]Wrote[/green] {output_path}", highlight=False)
+    return True
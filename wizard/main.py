@@ -0,0 +1,75 @@
+"""Entry point tying together the wizard's prompts, display and generation."""
+
+from __future__ import annotations
+
+import sys
+
+from wizard.cli import DEFAULT_OUTPUT, has_cli_args, parse_args, run_non_interactive_mode
+from wizard.exceptions import DependencyError
+from wizard.models import WizardConfig
+
+# Everything in this block needs rich. The imports are attempted eagerly
+# so the names stay patchable module attributes, but a missing rich must
+# not kill the module at import time — main() runs check_dependencies()
+# before touching any of them and reports the friendly error instead.
+try:
+    from rich.console import Console
+    from rich.prompt import Confirm
+
+    from wizard.display import display_banner, display_next_steps, display_summary
+    from wizard.generator import generate_tfvars
+    from wizard.prompts import configure_tags, select_environment, select_modules, select_region
+except ImportError:  # pragma: no cover - surfaced through check_dependencies
+    pass
+
+
+def check_dependencies() -> None:
+    """Verify that required third-party packages are importable."""
+    try:
+        import rich  # noqa: F401
+    except ImportError as error:
+        raise DependencyError(
+            "The setup wizard needs the 'rich' package; install it with 'pip install rich'."
+        ) from error
+
+
+def run_interactive_mode(console: Console) -> WizardConfig | None:
+    """Walk through the interactive prompts; returns None if the user bails."""
+    modules = select_modules(console)
+    region = select_region(console)
+    environment = select_environment(console)
+    tags = configure_tags(environment, console)
+    config = WizardConfig(modules=modules, region=region, environment=environment, tags=tags)
+    display_summary(config, console)
+    if not Confirm.ask("Proceed with this configuration?", default=True, console=console):
+        return None
+    return config
+
+
+def main(output_path: str = DEFAULT_OUTPUT) -> int:
+    """Run the wizard; returns a process exit code."""
+    try:
+        check_dependencies()
+    except DependencyError as error:
+        sys.stderr.write(f"Error: {error}\n")
+        return 1
+    args = parse_args()
+    console = Console()
+    display_banner(console)
+    if has_cli_args(args):
+        config = run_non_interactive_mode(args)
+        if args.output != DEFAULT_OUTPUT:
+            output_path = args.output
+    else:
+        config = run_interactive_mode(console)
+        if config is None:
+            console.print("[yellow]Aborted; nothing was written.[/yellow]")
+            return 1
+    if not generate_tfvars(config, output_path, console):
+        return 1
+    display_next_steps(output_path, console)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
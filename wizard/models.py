@@ -0,0 +1,64 @@
+"""Data models shared across the setup wizard."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class Module:
+    """One deployable security service from this baseline."""
+
+    name: str
+    display_name: str
+    description: str
+    var_name: str
+
+
+AVAILABLE_MODULES = (
+    Module(
+        name="cloudtrail",
+        display_name="AWS CloudTrail",
+        description="Multi-region API activity trail with encrypted S3 log storage",
+        var_name="enable_cloudtrail",
+    ),
+    Module(
+        name="config",
+        display_name="AWS Config",
+        description="Continuous recording and evaluation of resource configurations",
+        var_name="enable_config",
+    ),
+    Module(
+        name="detective",
+        display_name="Amazon Detective",
+        description="Security investigation graph built from CloudTrail and GuardDuty data",
+        var_name="enable_detective",
+    ),
+    Module(
+        name="guardduty",
+        display_name="Amazon GuardDuty",
+        description="Intelligent threat detection for accounts and workloads",
+        var_name="enable_guardduty",
+    ),
+    Module(
+        name="securityhub",
+        display_name="AWS Security Hub",
+        description="Aggregated security findings and standards compliance checks",
+        var_name="enable_securityhub",
+    ),
+)
+
+# Kept as an explicit literal so tests catch accidental registry edits.
+EXPECTED_MODULE_NAMES = frozenset(
+    {"cloudtrail", "config", "detective", "guardduty", "securityhub"}
+)
+
+
+@dataclass(slots=True)
+class WizardConfig:
+    """Everything the wizard collects before writing terraform.tfvars."""
+
+    modules: dict[str, bool] = field(default_factory=dict)
+    region: str = "us-east-1"
+    environment: str = "prod"
+    tags: dict[str, str] = field(default_factory=dict)
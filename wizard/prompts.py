@@ -0,0 +1,105 @@
+"""Interactive prompts for collecting wizard input."""
+
+from __future__ import annotations
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Confirm, Prompt
+from rich.text import Text
+
+from wizard.models import AVAILABLE_MODULES
+from wizard.validators import (
+    COMMON_REGIONS,
+    validate_environment,
+    validate_region,
+    validate_tag_key,
+)
+
+SUGGESTED_ENVIRONMENTS = ["prod", "staging", "dev", "test"]
+
+_DEFAULT_CONSOLE: Console | None = None
+
+
+def _console(console: Console | None) -> Console:
+    """Return the given console, or a lazily created shared default."""
+    global _DEFAULT_CONSOLE
+    if console is not None:
+        return console
+    if _DEFAULT_CONSOLE is None:
+        _DEFAULT_CONSOLE = Console()
+    return _DEFAULT_CONSOLE
+
+
+def select_region(console: Console | None = None) -> str:
+    """Prompt for an AWS region, by list number or custom region code."""
+    console = _console(console)
+    console.print("\n[bold]Select an AWS region[/bold]")
+    for index, region in enumerate(COMMON_REGIONS, start=1):
+        console.print(f"  [cyan]{index}.[/cyan] {region}")
+    while True:
+        choice = Prompt.ask(
+            "Region number or custom region code", default="1", console=console
+        ).strip()
+        if choice.isdecimal():
+            choice_num = int(choice)
+            if 1 <= choice_num <= len(COMMON_REGIONS):
+                return COMMON_REGIONS[choice_num - 1]
+            console.print("[red]Number out of range.[/red]")
+        elif validate_region(choice):
+            return choice
+        else:
+            console.print(f"[red]{choice!r} does not look like an AWS region code.[/red]")
+
+
+def select_environment(console: Console | None = None) -> str:
+    """Prompt for the environment name used in tags and terraform.tfvars."""
+    console = _console(console)
+    console.print("\n[bold]Select an environment name[/bold]")
+    for index, environment in enumerate(SUGGESTED_ENVIRONMENTS, start=1):
+        console.print(f"  [cyan]{index}.[/cyan] {environment}")
+    while True:
+        choice = Prompt.ask(
+            "Environment number or custom name", default="1", console=console
+        ).strip()
+        if choice.isdecimal():
+            choice_num = int(choice)
+            if 1 <= choice_num <= len(SUGGESTED_ENVIRONMENTS):
+                return SUGGESTED_ENVIRONMENTS[choice_num - 1]
+            console.print("[red]Number out of range.[/red]")
+        elif validate_environment(choice):
+            return choice
+        else:
+            console.print("[red]Environment names may only use letters, digits and hyphens.[/red]")
+
+
+def select_modules(console: Console | None = None) -> dict[str, bool]:
+    """Prompt for which baseline security services to enable."""
+    console = _console(console)
+    console.print("\n[bold]Choose which security services to enable[/bold]")
+    if Confirm.ask("Enable every service in the baseline?", default=True, console=console):
+        return {module.name: True for module in AVAILABLE_MODULES}
+    selections: dict[str, bool] = {}
+    for module in AVAILABLE_MODULES:
+        console.print(f"\n[bold]{module.display_name}[/bold]: {module.description}")
+        selections[module.name] = Confirm.ask(
+            f"Enable {module.display_name}?", default=True, console=console
+        )
+    return selections
+
+
+def configure_tags(environment: str, console: Console | None = None) -> dict[str, str]:
+    """Prompt for custom resource tags on top of the automatic baseline tags."""
+    console = _console(console)
+    tags = {"Environment": environment, "ManagedBy": "Terraform"}
+    console.print("\n[bold]Resource tags[/bold] (applied to everything the baseline creates)")
+    while Confirm.ask("Add a custom tag?", default=False, console=console):
+        key = Prompt.ask("Tag key", console=console)
+        if not validate_tag_key(key):
+            console.print("[red]Tag keys must be non-empty and must not contain '='.[/red]")
+            continue
+        tags[key] = Prompt.ask("Tag value", console=console)
+    summary = Text.from_markup(
+        "\n".join(f"  [cyan]{key}[/cyan] = [white]{value}[/white]" for key, value in tags.items())
+    )
+    console.print(Panel(summary, title="Resource Tags", border_style="cyan"))
+    return tags
@@ -0,0 +1,178 @@
+"""Tests for the wizard's command-line argument handling."""
+
+import functools
+from argparse import ArgumentTypeError
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from wizard.cli import (
+    _PARSER,
+    get_help_text,
+    has_cli_args,
+    parse_args,
+    run_non_interactive_mode,
+    validate_environment_arg,
+    validate_region_arg,
+    validate_tag_arg,
+)
+from wizard.models import AVAILABLE_MODULES
+
+_ALL_MODULE_NAMES = frozenset(m.name for m in AVAILABLE_MODULES)
+
+# Strategy construction is deferred behind cached accessors: st.deferred
+# only invokes the accessor on the first actual draw, so selective runs
+# (pytest -k some_unit_test) never pay for building strategies the
+# collected tests don't use. The shapes themselves are unchanged — valid
+# by construction, with no rejection-sampling .filter layers.
+
+
+@functools.cache
+def _valid_region_strategy():
+    two_lower = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=2, max_size=2)
+    lower_word = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=8)
+    digits = st.text(alphabet="0123456789", min_size=1, max_size=3)
+    return st.builds(lambda a, b, c: f"{a}-{b}-{c}", two_lower, lower_word, digits)
+
+
+@functools.cache
+def _valid_environment_strategy():
+    return st.from_regex(r"^[a-zA-Z0-9][a-zA-Z0-9-]*$", fullmatch=True)
+
+
+@functools.cache
+def _valid_tag_key_strategy():
+    # Zl/Zp (line/paragraph separators) strip to empty just like Zs
+    # spaces, so they must be excluded too or a one-character key such
+    # as U+2028 would fail validation.
+    excluded = ("Cc", "Cs", "Zs", "Zl", "Zp")
+    tail_chars = st.characters(blacklist_characters="=", blacklist_categories=excluded)
+    return st.builds(
+        lambda first, rest: first + rest,
+        st.characters(blacklist_characters="=-", blacklist_categories=excluded),
+        st.text(alphabet=tail_chars, min_size=0, max_size=49),
+    )
+
+
+# st.deferred insists on a plain function, so the cached accessors are
+# wrapped in lambdas rather than passed directly.
+valid_region_strategy = st.deferred(lambda: _valid_region_strategy())
+valid_environment_strategy = st.deferred(lambda: _valid_environment_strategy())
+valid_tag_key_strategy = st.deferred(lambda: _valid_tag_key_strategy())
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """The shared, already-built argument parser."""
+    return _PARSER
+
+
+class TestCLIDefaults:
+    def test_default_region_when_not_provided(self, parser):
+        args = parser.parse_args([])
+        assert args.region == "us-east-1"
+
+    def test_default_environment_when_not_provided(self, parser):
+        args = parser.parse_args([])
+        assert args.environment == "prod"
+
+    def test_default_output_path(self, parser):
+        args = parser.parse_args([])
+        assert args.output == "terraform.tfvars"
+
+    def test_no_tags_or_modules_by_default(self, parser):
+        args = parser.parse_args([])
+        assert args.tags is None
+        assert args.modules is None
+        assert args.all_modules is False
+
+
+class TestCLIValidation:
+    @pytest.mark.slow
+    @given(region=valid_region_strategy)
+    def test_valid_regions_accepted(self, region):
+        assert validate_region_arg(region) == region
+
+    @pytest.mark.slow
+    @given(environment=valid_environment_strategy)
+    def test_valid_environments_accepted(self, environment):
+        assert validate_environment_arg(environment) == environment
+
+    @pytest.mark.slow
+    @given(key=valid_tag_key_strategy)
+    def test_valid_tag_pairs_parse(self, key):
+        assert validate_tag_arg(f"{key}=some-value") == (key, "some-value")
+
+    def test_invalid_region_raises_error(self):
+        with pytest.raises(ArgumentTypeError):
+            validate_region_arg("Not A Region")
+
+    def test_invalid_environment_raises_error(self):
+        with pytest.raises(ArgumentTypeError):
+            validate_environment_arg("spaces are not allowed")
+
+    def test_invalid_tag_parsing(self):
+        with pytest.raises(ArgumentTypeError):
+            validate_tag_arg("no-equals-sign")
+
+
+class TestCLIHelperFunctions:
+    def test_has_cli_args_false_for_defaults(self):
+        assert has_cli_args(parse_args([])) is False
+
+    def test_has_cli_args_true_for_region(self):
+        assert has_cli_args(parse_args(["--region", "eu-west-1"])) is True
+
+    def test_has_cli_args_true_for_all_modules(self):
+        assert has_cli_args(parse_args(["--all-modules"])) is True
+
+    def test_has_cli_args_true_for_tags(self):
+        assert has_cli_args(parse_args(["--tag", "Team=Security"])) is True
+
+    def test_get_help_text_contains_expected_content(self):
+        help_text = get_help_text()
+        assert "--region" in help_text
+        assert "--environment" in help_text
+        assert "--all-modules" in help_text
+        assert "--tag" in help_text
+
+
+class TestCLIArgumentHandling:
+    def test_all_modules_flag_enables_all_modules(self):
+        config = run_non_interactive_mode(parse_args(["--all-modules"]))
+        enabled = frozenset(name for name, flag in config.modules.items() if flag is True)
+        assert enabled == _ALL_MODULE_NAMES
+
+    def test_modules_argument_enables_subset(self):
+        config = run_non_interactive_mode(parse_args(["--modules", "guardduty,config"]))
+        assert config.modules["guardduty"] is True
+        assert config.modules["config"] is True
+        assert config.modules["cloudtrail"] is False
+
+    def test_combined_arguments_set_all_values(self):
+        config = run_non_interactive_mode(
+            parse_args(
+                [
+                    "--region",
+                    "eu-west-1",
+                    "--environment",
+                    "staging",
+                    "--tag",
+                    "Team=Security",
+                    "--all-modules",
+                ]
+            )
+        )
+        assert config.region == "eu-west-1"
+        assert config.environment == "staging"
+        assert config.tags["Team"] == "Security"
+        assert config.tags["Environment"] == "staging"
+        enabled = frozenset(name for name, flag in config.modules.items() if flag is True)
+        assert enabled == _ALL_MODULE_NAMES
+
+    @pytest.mark.slow
+    @given(region=valid_region_strategy)
+    def test_region_round_trips_through_parser(self, region):
+        config = run_non_interactive_mode(parse_args(["--region", region]))
+        assert config.region == region
@@ -0,0 +1,136 @@
+"""Tests for the wizard's Rich display layer."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from rich.console import Console
+
+from wizard.display import (
+    GITHUB_URL,
+    display_banner,
+    display_next_steps,
+    get_banner_content,
+    get_next_steps_content,
+    get_summary_content,
+)
+from wizard.models import AVAILABLE_MODULES, WizardConfig
+
+# The leading character classes rule out empty strings and leading
+# hyphens, so no rejection-sampling .filter is needed on top.
+# Regions are composed from plain text parts rather than st.from_regex,
+# which drives a much slower regex-interpreting generator.
+_TWO_LOWER = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=2, max_size=2)
+_LOWER_WORD = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=8)
+_REGION_DIGITS = st.text(alphabet="0123456789", min_size=1, max_size=3)
+region_strategy = st.builds(
+    lambda a, b, c: f"{a}-{b}-{c}", _TWO_LOWER, _LOWER_WORD, _REGION_DIGITS
+)
+environment_strategy = st.from_regex(r"^[a-zA-Z0-9][a-zA-Z0-9-]*$", fullmatch=True)
+tags_strategy = st.dictionaries(
+    keys=st.from_regex(r"^[A-Za-z][A-Za-z0-9_]{0,19}$", fullmatch=True),
+    values=st.text(
+        alphabet=st.characters(min_codepoint=33, max_codepoint=126), min_size=1, max_size=20
+    ),
+    max_size=5,
+)
+# Expected summary fragments, built once instead of re-deriving
+# display names and status strings inside every Hypothesis example.
+_MODULE_NAMES = tuple(m.name for m in AVAILABLE_MODULES)
+_MODULE_DISPLAY_NAMES = tuple(m.display_name for m in AVAILABLE_MODULES)
+_ENABLED_LINES = tuple(f"{m.display_name}: Enabled" for m in AVAILABLE_MODULES)
+_DISABLED_LINES = tuple(f"{m.display_name}: Disabled" for m in AVAILABLE_MODULES)
+
+_FLAG_LISTS = st.lists(
+    st.booleans(), min_size=len(_MODULE_NAMES), max_size=len(_MODULE_NAMES)
+)
+
+
+@st.composite
+def _wizard_configs(draw):
+    """Draw a WizardConfig from one flag-list draw zipped with the fixed names."""
+    flags = draw(_FLAG_LISTS)
+    return WizardConfig(
+        modules=dict(zip(_MODULE_NAMES, flags)),
+        region=draw(region_strategy),
+        environment=draw(environment_strategy),
+        tags=draw(tags_strategy),
+    )
+
+
+wizard_config_strategy = _wizard_configs()
+
+
+class TestBannerContent:
+    def test_banner_is_not_empty(self):
+        assert get_banner_content().strip()
+
+    @pytest.mark.parametrize(
+        "needle", ["Deploy AWS security services with confidence", GITHUB_URL]
+    )
+    def test_banner_contains_expected_content(self, needle):
+        assert needle in get_banner_content()
+
+    def test_display_banner_returns_content(self):
+        result = display_banner(console=None)
+        assert result == get_banner_content()
+
+    def test_display_banner_prints_to_console(self):
+        console = Console(width=120)
+        with console.capture() as capture:
+            display_banner(console)
+        assert "confidence" in capture.get()
+
+    def test_display_banner_without_console_argument(self):
+        result = display_banner()
+        assert "confidence" in result
+
+
+class TestNextStepsContent:
+    @pytest.mark.parametrize(
+        "needle", ["terraform init", "terraform plan", "terraform apply", "aws configure"]
+    )
+    def test_next_steps_contains_commands(self, needle):
+        assert needle in get_next_steps_content("terraform.tfvars")
+
+    def test_next_steps_contains_output_path(self):
+        assert "custom.tfvars" in get_next_steps_content("custom.tfvars")
+
+    def test_display_next_steps_returns_content(self):
+        result = display_next_steps("terraform.tfvars", console=None)
+        assert result == get_next_steps_content("terraform.tfvars")
+
+    def test_display_next_steps_prints_to_console(self):
+        console = Console(width=120)
+        with console.capture() as capture:
+            display_next_steps("terraform.tfvars", console)
+        assert "terraform init" in capture.get()
+
+
+class TestSummaryCompleteness:
+    """All summary invariants checked against a single render per example."""
+
+    def _assert_module_names(self, summary):
+        for display_name in _MODULE_DISPLAY_NAMES:
+            assert display_name in summary
+
+    def _assert_module_status(self, summary, config):
+        modules = config.modules
+        for name, enabled_line, disabled_line in zip(
+            _MODULE_NAMES, _ENABLED_LINES, _DISABLED_LINES
+        ):
+            assert (enabled_line if modules.get(name, False) else disabled_line) in summary
+
+    def _assert_tags(self, summary, config):
+        needed = set(config.tags.keys()) | set(config.tags.values())
+        missing = {token for token in needed if token not in summary}
+        assert not missing, f"summary is missing {missing!r}"
+
+    @pytest.mark.slow
+    @given(config=wizard_config_strategy)
+    def test_summary_contains_everything(self, config):
+        summary = get_summary_content(config)
+        self._assert_module_names(summary)
+        self._assert_module_status(summary, config)
+        assert config.region in summary
+        assert config.environment in summary
+        self._assert_tags(summary, config)
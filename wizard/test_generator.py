@@ -0,0 +1,160 @@
+"""Tests for terraform.tfvars generation and parsing."""
+
+from functools import lru_cache
+from io import StringIO
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from rich.console import Console
+
+from wizard.generator import (
+    generate_tfvars,
+    generate_tfvars_content,
+    parse_tfvars_content,
+)
+from wizard.models import AVAILABLE_MODULES, EXPECTED_MODULE_NAMES, WizardConfig
+
+# Length bounds are encoded in the patterns themselves, so Hypothesis
+# never generates a draw only to reject it through a .filter predicate.
+region_strategy = st.from_regex(r"^[a-z]{2}-[a-z]+-\d+$", fullmatch=True)
+environment_strategy = st.from_regex(r"[a-zA-Z][a-zA-Z0-9-]{0,19}", fullmatch=True)
+tag_key_strategy = st.from_regex(r"[a-zA-Z][a-zA-Z0-9_]{0,29}", fullmatch=True)
+# Values are bounded printable ASCII without quotes/backslashes; the
+# escaping corner cases are covered by the dedicated example-based
+# test_tags_with_special_characters instead of every property draw.
+tag_value_strategy = st.text(
+    alphabet=st.characters(min_codepoint=32, max_codepoint=126, blacklist_characters='"\\'),
+    min_size=1,
+    max_size=50,
+)
+tags_strategy = st.dictionaries(keys=tag_key_strategy, values=tag_value_strategy, max_size=5)
+module_selection_strategy = st.fixed_dictionaries(
+    {name: st.booleans() for name in sorted(EXPECTED_MODULE_NAMES)}
+)
+wizard_config_strategy = st.builds(
+    WizardConfig,
+    modules=module_selection_strategy,
+    region=region_strategy,
+    environment=environment_strategy,
+    tags=tags_strategy,
+)
+
+
+def _freeze(config):
+    """A hashable key capturing everything the generator reads."""
+    return (
+        config.region,
+        config.environment,
+        tuple(sorted(config.modules.items())),
+        tuple(sorted(config.tags.items())),
+    )
+
+
+def _rebuild(key):
+    region, environment, modules, tags = key
+    return WizardConfig(
+        modules=dict(modules), region=region, environment=environment, tags=dict(tags)
+    )
+
+
+# Hypothesis re-runs the same shrunken configs many times while
+# simplifying a failure; memoizing config -> content skips the repeated
+# HCL serialization on those hits.
+@lru_cache(maxsize=512)
+def _gen_cached(key):
+    return generate_tfvars_content(_rebuild(key))
+
+
+# Shared read-only configs; generator code never mutates its input, so
+# module scope is safe and the dict comprehensions run once per module.
+@pytest.fixture(scope="module")
+def enabled_config():
+    return WizardConfig(
+        modules={name: True for name in EXPECTED_MODULE_NAMES},
+        region="us-east-1",
+        environment="test",
+        tags={"Environment": "test", "ManagedBy": "Terraform"},
+    )
+
+
+@pytest.fixture(scope="module")
+def null_console():
+    """A console for tests that never read the output; quiet mode skips
+    Rich's styled-segment rendering entirely."""
+    return Console(quiet=True)
+
+
+@pytest.fixture(scope="module")
+def disabled_config():
+    return WizardConfig(
+        modules={name: False for name in EXPECTED_MODULE_NAMES},
+        region="eu-west-1",
+        environment="staging",
+        tags={"Environment": "staging", "ManagedBy": "Terraform"},
+    )
+
+
+class TestTfvarsRoundTrip:
+    """One generate/parse cycle per example verifies every field."""
+
+    @pytest.mark.slow
+    @given(config=wizard_config_strategy)
+    def test_round_trip_preserves_all(self, config):
+        content = _gen_cached(_freeze(config))
+        parsed = parse_tfvars_content(content)
+        assert parsed.region == config.region
+        assert parsed.environment == config.environment
+        assert parsed.tags == config.tags
+        # One C-level dict compare instead of a per-module assert ladder.
+        expected = {name: config.modules.get(name, False) for name in EXPECTED_MODULE_NAMES}
+        actual = {name: parsed.modules.get(name, False) for name in EXPECTED_MODULE_NAMES}
+        assert actual == expected, (
+            f"modules differ for {sorted(name for name in EXPECTED_MODULE_NAMES if actual[name] != expected[name])}"
+        )
+
+    @pytest.mark.slow
+    @given(config=wizard_config_strategy)
+    def test_module_flag_lines_in_output(self, config):
+        content = _gen_cached(_freeze(config))
+        # Split once and test set membership rather than rescanning the
+        # whole content string for every module's substring.
+        lines = frozenset(line.strip() for line in content.splitlines())
+        for module in AVAILABLE_MODULES:
+            enabled = config.modules.get(module.name, False)
+            expected = f"{module.var_name} = {'true' if enabled else 'false'}"
+            assert expected in lines
+
+
+class TestTfvarsGeneration:
+    def test_generate_tfvars_creates_file(self, tmp_path, enabled_config, null_console):
+        temp_path = tmp_path / "terraform.tfvars"
+        assert generate_tfvars(enabled_config, str(temp_path), null_console) is True
+        assert 'aws_region = "us-east-1"' in temp_path.read_text(encoding="utf-8")
+
+    def test_generate_tfvars_displays_path(self, tmp_path, enabled_config):
+        temp_path = tmp_path / "terraform.tfvars"
+        output = StringIO()
+        # Wide enough that long tmp_path names never wrap mid-assertion.
+        console = Console(file=output, force_terminal=True, width=500)
+        generate_tfvars(enabled_config, str(temp_path), console)
+        assert str(temp_path) in output.getvalue()
+
+    def test_generated_content_has_valid_hcl_syntax(self, disabled_config):
+        content = generate_tfvars_content(disabled_config)
+        assert content.count("{") == content.count("}")
+        assert 'environment = "staging"' in content
+
+    def test_tags_with_special_characters(self):
+        config = WizardConfig(
+            modules={name: True for name in EXPECTED_MODULE_NAMES},
+            region="us-east-1",
+            environment="test",
+            tags={"Quote": 'say "hello"', "Backslash": "a\\b"},
+        )
+        parsed = parse_tfvars_content(generate_tfvars_content(config))
+        assert parsed.tags == config.tags
+
+    def test_returns_false_when_write_fails(self, tmp_path, enabled_config, null_console):
+        bad_path = tmp_path / "no-such-dir" / "out.tfvars"
+        assert generate_tfvars(enabled_config, str(bad_path), null_console) is False
@@ -0,0 +1,156 @@
+"""Tests for the wizard entry point, dependency checks and exceptions."""
+
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from wizard.exceptions import (
+    DependencyError,
+    FileGenerationError,
+    InvalidInputError,
+    WizardError,
+)
+from wizard.main import check_dependencies, main
+from wizard.models import EXPECTED_MODULE_NAMES, WizardConfig
+from wizard.validators import validate_environment, validate_region
+
+# Compiled once; the filter lambda runs on every Hypothesis draw.
+_REGION_RE = re.compile(r"^[a-z]{2}-[a-z]+-\d+$")
+
+invalid_region_strategy = st.text(min_size=1, max_size=20).filter(
+    lambda x: not _REGION_RE.match(x)
+)
+# A small ASCII alphabet of known-invalid characters is far cheaper to
+# draw from than blacklisting whole Unicode categories per character.
+invalid_environment_strategy = st.text(
+    alphabet=st.sampled_from(list("!@#$%^&*() /\\:;")),
+    min_size=1,
+    max_size=10,
+)
+
+_DEFAULT_ARGS = SimpleNamespace(output="terraform.tfvars")
+
+
+def _mock_config():
+    return WizardConfig(
+        modules={name: True for name in EXPECTED_MODULE_NAMES},
+        region="us-east-1",
+        environment="test",
+        tags={"Environment": "test", "ManagedBy": "Terraform"},
+    )
+
+
+class TestInputRejection:
+    @pytest.mark.slow
+    @given(region=invalid_region_strategy)
+    def test_invalid_region_does_not_proceed(self, region):
+        assert validate_region(region) is False
+
+    @pytest.mark.slow
+    @given(environment=invalid_environment_strategy)
+    def test_invalid_environment_does_not_proceed(self, environment):
+        # The strategy's alphabet cannot produce a valid name, so no
+        # assume precondition is needed.
+        assert validate_environment(environment) is False
+
+
+class TestMainFunction:
+    @pytest.fixture(autouse=True)
+    def _patch_ui(self, monkeypatch):
+        """Silence banner/next-steps output and skip the dependency probe."""
+        monkeypatch.setattr("wizard.main.display_banner", lambda *a, **k: None)
+        monkeypatch.setattr("wizard.main.display_next_steps", lambda *a, **k: None)
+        monkeypatch.setattr("wizard.main.check_dependencies", lambda: None)
+
+    def test_main_returns_zero_on_success(self, tmp_path):
+        output_file = tmp_path / "terraform.tfvars"
+        with patch.multiple(
+            "wizard.main",
+            parse_args=MagicMock(return_value=_DEFAULT_ARGS),
+            has_cli_args=MagicMock(return_value=True),
+            run_non_interactive_mode=MagicMock(return_value=_mock_config()),
+            generate_tfvars=MagicMock(return_value=True),
+        ):
+            result = main(str(output_file))
+        assert result == 0
+
+    def test_main_returns_one_when_generation_fails(self, tmp_path):
+        output_file = tmp_path / "terraform.tfvars"
+        with patch.multiple(
+            "wizard.main",
+            parse_args=MagicMock(return_value=_DEFAULT_ARGS),
+            has_cli_args=MagicMock(return_value=True),
+            run_non_interactive_mode=MagicMock(return_value=_mock_config()),
+            generate_tfvars=MagicMock(return_value=False),
+        ):
+            result = main(str(output_file))
+        assert result == 1
+
+    def test_main_returns_one_when_interactive_cancelled(self, tmp_path):
+        output_file = tmp_path / "terraform.tfvars"
+        with patch.multiple(
+            "wizard.main",
+            parse_args=MagicMock(return_value=_DEFAULT_ARGS),
+            has_cli_args=MagicMock(return_value=False),
+            run_interactive_mode=MagicMock(return_value=None),
+        ):
+            result = main(str(output_file))
+        assert result == 1
+
+    def test_main_uses_cli_output_path(self, tmp_path):
+        cli_args = SimpleNamespace(output=str(tmp_path / "custom.tfvars"))
+        gen = MagicMock(return_value=True)
+        with patch.multiple(
+            "wizard.main",
+            parse_args=MagicMock(return_value=cli_args),
+            has_cli_args=MagicMock(return_value=True),
+            run_non_interactive_mode=MagicMock(return_value=_mock_config()),
+            generate_tfvars=gen,
+        ):
+            main()
+        assert gen.call_args.args[1] == cli_args.output
+
+
+class TestCheckDependencies:
+    def test_check_dependencies_passes_when_rich_available(self):
+        check_dependencies()
+
+    def test_check_dependencies_raises_when_rich_missing(self):
+        real_import = __import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "rich":
+                raise ImportError("No module named 'rich'")
+            return real_import(name, *args, **kwargs)
+
+        # The import statement always goes through builtins.__import__,
+        # so patching it alone suffices — no sys.modules surgery needed.
+        with patch("builtins.__import__", side_effect=fake_import):
+            with pytest.raises(DependencyError) as exc_info:
+                check_dependencies()
+        assert "rich" in str(exc_info.value)
+        assert "pip install rich" in str(exc_info.value)
+
+
+class TestExceptionTypes:
+    @pytest.mark.parametrize(
+        ("exception_type", "message"),
+        [
+            (InvalidInputError, "Invalid region format"),
+            (FileGenerationError, "Permission denied"),
+            (DependencyError, "Missing package"),
+        ],
+    )
+    def test_exception_preserves_message(self, exception_type, message):
+        with pytest.raises(exception_type) as exc_info:
+            raise exception_type(message)
+        assert message in str(exc_info.value)
+
+    def test_all_derive_from_wizard_error(self):
+        assert issubclass(InvalidInputError, WizardError)
+        assert issubclass(FileGenerationError, WizardError)
+        assert issubclass(DependencyError, WizardError)
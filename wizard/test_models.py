@@ -0,0 +1,57 @@
+"""Tests for the wizard's module registry and data models."""
+
+import pytest
+
+from wizard.models import AVAILABLE_MODULES, EXPECTED_MODULE_NAMES
+
+# Derived once at import for the duplicate-detection tests rather than
+# rebuilt inside each test body.
+_NAMES_LIST = [module.name for module in AVAILABLE_MODULES]
+_VAR_NAMES_LIST = [module.var_name for module in AVAILABLE_MODULES]
+
+
+@pytest.fixture(scope="session")
+def registry_names():
+    """The registry's module names, computed once per test session."""
+    return frozenset(module.name for module in AVAILABLE_MODULES)
+
+
+class TestModuleRegistry:
+    def test_registry_contains_all_expected_modules(self, registry_names):
+        assert registry_names == EXPECTED_MODULE_NAMES
+
+    # The registry is a tiny finite set, so plain parametrization covers
+    # it exhaustively — no Hypothesis sampling needed.
+    @pytest.mark.parametrize("module_name", sorted(EXPECTED_MODULE_NAMES))
+    def test_each_expected_module_exists_in_registry(self, module_name, registry_names):
+        assert module_name in registry_names
+
+    @pytest.mark.parametrize("module", AVAILABLE_MODULES, ids=lambda m: m.name)
+    def test_each_registry_module_is_expected(self, module):
+        assert module.name in EXPECTED_MODULE_NAMES
+
+    def test_no_duplicate_names(self):
+        assert len(_NAMES_LIST) == len(set(_NAMES_LIST))
+
+    def test_no_duplicate_var_names(self):
+        assert len(_VAR_NAMES_LIST) == len(set(_VAR_NAMES_LIST))
+
+
+class TestModuleFields:
+    # Single list-comprehension checks instead of a per-module assert
+    # ladder; the comprehension result doubles as the failure message.
+    def test_all_modules_have_required_fields(self):
+        bad = [
+            module.name or "(unnamed)"
+            for module in AVAILABLE_MODULES
+            if not (module.name and module.display_name and module.description and module.var_name)
+        ]
+        assert not bad, f"modules missing fields: {bad}"
+
+    def test_all_var_names_follow_convention(self):
+        mismatches = [
+            (module.name, module.var_name)
+            for module in AVAILABLE_MODULES
+            if module.var_name != f"enable_{module.name}"
+        ]
+        assert not mismatches, f"var_name convention violations: {mismatches}"
@@ -0,0 +1,117 @@
+"""Tests for the wizard's interactive prompt flow."""
+
+import itertools
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from wizard.models import AVAILABLE_MODULES, EXPECTED_MODULE_NAMES
+from wizard.prompts import (
+    COMMON_REGIONS,
+    SUGGESTED_ENVIRONMENTS,
+    configure_tags,
+    select_environment,
+    select_modules,
+    select_region,
+)
+from wizard.validators import validate_region
+
+_ALL_MODULE_NAMES = tuple(module.name for module in AVAILABLE_MODULES)
+
+
+class TestModuleSelectionRoundTrip:
+    # With five modules the whole truth table is only 2^5 = 32 cases, so
+    # sweeping select_modules exhaustively is cheaper than sampling it
+    # through Hypothesis and gives strictly stronger coverage. The first
+    # Confirm answer declines the enable-everything shortcut; the rest
+    # answer the per-module prompts in registry order.
+    @pytest.mark.parametrize(
+        "bits", list(itertools.product([False, True], repeat=len(EXPECTED_MODULE_NAMES)))
+    )
+    def test_module_truth_table(self, bits):
+        with patch("wizard.prompts.Confirm.ask", side_effect=[False, *bits]):
+            selections = select_modules(Console(quiet=True))
+        assert selections == dict(zip(_ALL_MODULE_NAMES, bits))
+
+
+class TestRegionConfiguration:
+    def test_default_region_is_first_common_region(self):
+        assert COMMON_REGIONS[0] == "us-east-1"
+
+    def test_all_common_regions_validate(self):
+        bad = [region for region in COMMON_REGIONS if not validate_region(region)]
+        assert not bad, f"invalid regions in COMMON_REGIONS: {bad}"
+
+    def test_numeric_choice_selects_from_list(self):
+        with patch("wizard.prompts.Prompt.ask", return_value="2"):
+            assert select_region(Console(quiet=True)) == COMMON_REGIONS[1]
+
+    def test_custom_region_code_is_accepted(self):
+        with patch("wizard.prompts.Prompt.ask", return_value="eu-north-1"):
+            assert select_region(Console(quiet=True)) == "eu-north-1"
+
+
+class TestEnvironmentConfiguration:
+    def test_numeric_choice_selects_from_list(self):
+        with patch("wizard.prompts.Prompt.ask", return_value="2"):
+            assert select_environment(Console(quiet=True)) == SUGGESTED_ENVIRONMENTS[1]
+
+    def test_custom_environment_name_is_accepted(self):
+        with patch("wizard.prompts.Prompt.ask", return_value="blue-green"):
+            assert select_environment(Console(quiet=True)) == "blue-green"
+
+
+class TestModuleSelection:
+    def test_deploy_all_enables_all_modules(self):
+        with patch("wizard.prompts.Confirm.ask", return_value=True):
+            selections = select_modules(Console(quiet=True))
+        # dict.fromkeys over the precomputed names is one C-level loop.
+        assert selections == dict.fromkeys(_ALL_MODULE_NAMES, True)
+
+    def test_individual_selection_covers_every_module(self):
+        with patch("wizard.prompts.Confirm.ask", side_effect=[False, True, False, True, False, True]):
+            selections = select_modules(Console(quiet=True))
+        assert selections.keys() == EXPECTED_MODULE_NAMES
+
+
+@pytest.fixture(scope="session")
+def base_tags():
+    """Expected automatic baseline tags, built once per test session."""
+    return {"Environment": "test", "ManagedBy": "Terraform"}
+
+
+class TestTagHandling:
+    # validate_tag_key itself is covered at the validator layer in
+    # test_validators.py; this class drives configure_tags through
+    # scripted prompts and checks the tags it returns.
+    def test_no_custom_tags_returns_baseline(self, base_tags):
+        with patch("wizard.prompts.Confirm.ask", return_value=False):
+            tags = configure_tags("test", Console(quiet=True))
+        assert tags == base_tags
+
+    def test_custom_tags_are_recorded(self, base_tags):
+        with (
+            patch("wizard.prompts.Confirm.ask", side_effect=[True, False]),
+            patch("wizard.prompts.Prompt.ask", side_effect=["Team", "platform"]),
+        ):
+            tags = configure_tags("test", Console(quiet=True))
+        assert tags == {**base_tags, "Team": "platform"}
+
+    def test_invalid_key_is_rejected_and_retried(self, base_tags):
+        # "bad=key" fails validation, so no value is prompted for it and
+        # the add loop comes back around for a usable key.
+        with (
+            patch("wizard.prompts.Confirm.ask", side_effect=[True, True, False]),
+            patch("wizard.prompts.Prompt.ask", side_effect=["bad=key", "Team", "platform"]),
+        ):
+            tags = configure_tags("test", Console(quiet=True))
+        assert tags == {**base_tags, "Team": "platform"}
+
+    def test_custom_environment_key_overwrites_baseline(self):
+        with (
+            patch("wizard.prompts.Confirm.ask", side_effect=[True, False]),
+            patch("wizard.prompts.Prompt.ask", side_effect=["Environment", "qa"]),
+        ):
+            tags = configure_tags("test", Console(quiet=True))
+        assert tags == {"Environment": "qa", "ManagedBy": "Terraform"}
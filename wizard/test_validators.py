@@ -0,0 +1,142 @@
+"""Tests for the wizard's input validators."""
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from wizard.validators import (
+    AWS_REGION_PATTERN,
+    validate_environment,
+    validate_region,
+    validate_tag_key,
+)
+
+# Valid inputs are composed from plain alphabet parts rather than
+# st.from_regex, whose regex-driven generator is markedly slower and
+# less uniform than direct text draws.
+_TWO_LOWER = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=2, max_size=2)
+_LOWER_WORD = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=10)
+_REGION_DIGITS = st.text(alphabet="0123456789", min_size=1, max_size=3)
+valid_region_strategy = st.builds(
+    "{}-{}-{}".format, _TWO_LOWER, _LOWER_WORD, _REGION_DIGITS
+)
+valid_environment_strategy = st.text(
+    alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-",
+    min_size=1,
+    max_size=20,
+)
+
+# Filter predicates are top-level named functions; the default-argument
+# binding keeps the pattern's bound match method in a local instead of a
+# global lookup on every draw.
+def _not_region(candidate, _match=AWS_REGION_PATTERN.match):
+    return _match(candidate) is None
+
+
+def _usable_tag_key(candidate):
+    return not candidate.isspace() and "=" not in candidate
+
+
+# Invalid inputs are built to be invalid by construction, so no draw is
+# ever discarded through an assume() precondition: a region needs a
+# hyphen and lowercase letters, an environment may not contain
+# punctuation or whitespace.
+_definitely_invalid_region = st.one_of(
+    st.just(""),
+    st.text(min_size=1, max_size=20).filter(_not_region),
+    st.text(alphabet="ABCDEFGHIJKLMNOPQRSTUVWXYZ_ /.@", min_size=1, max_size=20),
+)
+_definitely_invalid_environment = st.one_of(
+    st.just(""),
+    st.text(alphabet="!@#$%^&*() /\\:;", min_size=1, max_size=10),
+)
+nonblank_tag_key_strategy = st.text(min_size=1, max_size=30).filter(_usable_tag_key)
+
+
+class TestRegionValidation:
+    # Batch the per-example checks into one array assert so a failure
+    # reports every offending input at once instead of stopping at the
+    # first.
+    def test_known_valid_regions(self):
+        valid_regions = ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-2"]
+        results = np.fromiter(
+            (validate_region(region) for region in valid_regions),
+            dtype=bool,
+            count=len(valid_regions),
+        )
+        assert results.all(), (
+            f"rejected: {[r for r, ok in zip(valid_regions, results) if not ok]}"
+        )
+
+    def test_known_invalid_regions(self):
+        invalid_regions = ["", "us-east", "US-EAST-1", "us_east_1", "useast1", "us-east-one"]
+        results = np.fromiter(
+            (validate_region(region) for region in invalid_regions),
+            dtype=bool,
+            count=len(invalid_regions),
+        )
+        assert not results.any(), (
+            f"accepted: {[r for r, ok in zip(invalid_regions, results) if ok]}"
+        )
+
+    @pytest.mark.slow
+    @given(region=valid_region_strategy)
+    def test_valid_regions_pass_validation(self, region):
+        assert validate_region(region) is True
+
+    @pytest.mark.slow
+    @given(region=_definitely_invalid_region)
+    def test_invalid_regions_fail_validation(self, region):
+        assert validate_region(region) is False
+
+
+class TestEnvironmentValidation:
+    def test_known_valid_environments(self):
+        valid_environments = ["prod", "staging", "dev", "test", "blue-green", "Prod1"]
+        results = np.fromiter(
+            (validate_environment(environment) for environment in valid_environments),
+            dtype=bool,
+            count=len(valid_environments),
+        )
+        assert results.all(), (
+            f"rejected: {[e for e, ok in zip(valid_environments, results) if not ok]}"
+        )
+
+    def test_known_invalid_environments(self):
+        invalid_environments = ["", "prod!", "my env", "prod/test", "näme"]
+        results = np.fromiter(
+            (validate_environment(environment) for environment in invalid_environments),
+            dtype=bool,
+            count=len(invalid_environments),
+        )
+        assert not results.any(), (
+            f"accepted: {[e for e, ok in zip(invalid_environments, results) if ok]}"
+        )
+
+    @pytest.mark.slow
+    @given(environment=valid_environment_strategy)
+    def test_valid_environments_pass_validation(self, environment):
+        assert validate_environment(environment) is True
+
+    @pytest.mark.slow
+    @given(environment=_definitely_invalid_environment)
+    def test_invalid_environments_fail_validation(self, environment):
+        assert validate_environment(environment) is False
+
+
+class TestTagKeyValidation:
+    @pytest.mark.slow
+    @given(key=nonblank_tag_key_strategy)
+    def test_non_empty_tag_keys_pass_validation(self, key):
+        assert validate_tag_key(key) is True
+
+    @pytest.mark.parametrize("key", ["", " ", "\t", "\n", "  \t\n  "])
+    def test_blank_tag_keys_fail_validation(self, key):
+        assert validate_tag_key(key) is False
+
+    def test_tag_key_with_equals_sign_fails(self):
+        assert validate_tag_key("bad=key") is False
+
+    def test_non_string_tag_key_fails(self):
+        assert validate_tag_key(None) is False
@@ -0,0 +1,91 @@
+"""Input validation shared by wizard prompts and CLI arguments."""
+
+from __future__ import annotations
+
+import functools
+import re
+import string
+
+AWS_REGION_PATTERN = re.compile(r"^[a-z]{2}-[a-z]+-\d+$")
+
+# Canonical list of commonly used regions, ordered for prompt display;
+# the frozenset alongside it gives validate_region an O(1) fast path.
+COMMON_REGIONS = (
+    "us-east-1",
+    "us-east-2",
+    "us-west-1",
+    "us-west-2",
+    "eu-west-1",
+    "eu-west-2",
+    "eu-central-1",
+    "ap-southeast-1",
+    "ap-southeast-2",
+    "ap-northeast-1",
+)
+COMMON_REGIONS_SET = frozenset(COMMON_REGIONS)
+# Kept for importers that want the declarative form; validate_environment
+# itself uses the translation table below.
+ENVIRONMENT_PATTERN = re.compile(r"^[a-zA-Z0-9-]+$")
+
+# Deletion table: translating a valid name through it yields "".
+_ENV_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "-")
+
+# The validators are pure functions of their input, so repeated calls on
+# the same string (Hypothesis shrinking replays, prompt retry loops) are
+# answered from the cache. The cached inner functions only ever see str,
+# which keeps unhashable inputs away from the lru_cache machinery.
+
+
+@functools.lru_cache(maxsize=4096)
+def _region_matches(region: str) -> bool:
+    return AWS_REGION_PATTERN.match(region) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _environment_matches(environment: str) -> bool:
+    return not environment.translate(_ENV_DELETE)
+
+
+def validate_region(region: object) -> bool:
+    """Return True if region looks like an AWS region code such as us-east-1."""
+    # Shortest valid code is "xx-east-1" shaped: 2 letters, hyphen at
+    # index 2. Rejecting on those cheap checks skips the regex engine
+    # for the vast majority of arbitrary strings.
+    if not isinstance(region, str):
+        return False
+    if region in COMMON_REGIONS_SET:
+        return True
+    if len(region) < 6 or region[2] != "-":
+        return False
+    return _region_matches(region)
+
+
+def validate_environment(environment: object) -> bool:
+    """Return True if environment is a non-empty alphanumeric-or-hyphen name."""
+    # str.translate with a deletion table is one C loop over the buffer;
+    # a valid name has every character deleted. isascii() still rejects
+    # most arbitrary input before the table is consulted. A per-character
+    # isalnum() scan only wins on invalid input it can reject early;
+    # translate is faster on every valid name, which is the common case.
+    if not isinstance(environment, str) or not environment or not environment.isascii():
+        return False
+    return _environment_matches(environment)
+
+
+@functools.lru_cache(maxsize=4096)
+def _tag_key_ok(key: str) -> bool:
+    if "=" in key:
+        return False
+    # Short-circuit on the first non-whitespace character instead of
+    # allocating the stripped copy just to measure its length.
+    for character in key:
+        if not character.isspace():
+            return True
+    return False
+
+
+def validate_tag_key(key: object) -> bool:
+    """Return True if key is usable as a Terraform tag map key."""
+    if not isinstance(key, str):
+        return False
+    return _tag_key_ok(key)